@@ -55,7 +55,7 @@ def create_app(store: MetadataStore | None = None, data: DuckDBStore | None = No
         ("atribuicao_export_jobs", atribuicoes.process_export),
         ("derived_column_jobs", lambda row: bases.process_derived(
             int(row["base_id"]), row["source_column"], row["operation"])),
-    ])
+    ], concurrency=int(os.environ.get("WORKER_CONCURRENCY", "1")))  # ver JobWorker
 
     @asynccontextmanager
     async def lifespan(_app: FastAPI):  # type: ignore[no-untyped-def]
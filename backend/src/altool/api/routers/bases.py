@@ -3,7 +3,6 @@ upload multipart, ingest assíncrono, delete)."""
 
 from __future__ import annotations
 
-import os
 import shutil
 import uuid
 from pathlib import Path
@@ -14,6 +13,7 @@ from fastapi import APIRouter, Body, File, Form, Request, UploadFile
 from fastapi.responses import JSONResponse
 
 from ...services.bases import BasesService
+from ...services.paths import upload_dir
 
 router = APIRouter(prefix="/bases", tags=["bases"])
 
@@ -52,12 +52,6 @@ def delete_subtype(sub_id: int, request: Request) -> dict:
     return _svc(request).delete_subtype(sub_id)
 
 
-def _upload_dir() -> Path:
-    d = Path(os.environ.get("UPLOAD_DIR") or (Path(os.environ.get("DATA_DIR", ".")) / "uploads"))
-    d.mkdir(parents=True, exist_ok=True)
-    return d
-
-
 @router.get("")
 def list_bases(
     request: Request, page: int = 1, pageSize: int | None = None,
@@ -156,7 +150,7 @@ async def create_bases(  # type: ignore[no-untyped-def]
     header_coluna_inicial: int = Form(1),
     reference_base_id: int | None = Form(None),
 ):
-    updir = _upload_dir()
+    updir = upload_dir()
     items = []
     for f in arquivo:
         safe = f"{uuid.uuid4().hex}_{Path(f.filename or 'arquivo').name}"
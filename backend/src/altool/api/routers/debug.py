@@ -11,7 +11,7 @@ from fastapi import APIRouter, Request
 
 router = APIRouter(prefix="/debug", tags=["debug"])
 
-# Filas de job do sidecar (o modelo v2 é fila SQLite + worker único; não há pool de threads).
+# Filas de job do sidecar (fila SQLite + JobWorker com N threads; DuckDB serializado).
 _QUEUES = ["ingest_jobs", "jobs_conciliacao", "export_jobs", "atribuicao_runs", "atribuicao_export_jobs"]
 
 
@@ -27,7 +27,8 @@ def workers(request: Request) -> dict:
         pools[q] = counts
     return {
         "enabled": True,
-        "config": {"model": "single-worker + DuckDB multi-thread interno"},
+        "config": {"model": "JobWorker + DuckDB multi-thread interno",
+                   "concurrency": request.app.state.worker.concurrency},
         "pools": pools,
         "stats": {},
     }
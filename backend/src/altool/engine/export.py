@@ -23,6 +23,12 @@ DEFAULT_MONETARY = ("value_a", "value_b", "difference")
 
 _FETCH_CHUNK = 10_000
 
+_NUMERIC_TYPES = frozenset({
+    "TINYINT", "SMALLINT", "INTEGER", "BIGINT", "HUGEINT",
+    "UTINYINT", "USMALLINT", "UINTEGER", "UBIGINT", "UHUGEINT",
+    "FLOAT", "DOUBLE",
+})
+
 
 def export_resultado_xlsx(
     con: duckdb.DuckDBPyConnection,
@@ -41,10 +47,10 @@ def export_resultado_xlsx(
     import xlsxwriter
 
     Path(out_path).parent.mkdir(parents=True, exist_ok=True)
-    columns = [d[0] for d in con.execute(
-        f'SELECT * FROM "{result_table}" LIMIT 0'
-    ).description]
-    money_idx = {i for i, c in enumerate(columns) if c in set(monetary_cols)}
+    desc = con.execute(f'SELECT * FROM "{result_table}" LIMIT 0').description
+    columns = [d[0] for d in desc]
+    numeric = {d[0] for d in desc if _is_numeric_type(str(d[1]))}
+    monetary = set(monetary_cols)
 
     wb = xlsxwriter.Workbook(out_path, {"constant_memory": True})
     try:
@@ -57,6 +63,32 @@ def export_resultado_xlsx(
         for col, name in enumerate(columns):
             ws.write(0, col, name, header_fmt)
 
+        # Métodos ligados uma vez: as closures abaixo rodam por célula e evitam o lookup
+        # de atributo em `ws` a cada chamada.
+        write = ws.write
+        write_number = ws.write_number
+        as_number = _as_number
+
+        def write_money(row: int, col: int, value: object) -> None:
+            num = as_number(value)
+            if num is None:
+                write(row, col, value)
+            else:
+                write_number(row, col, num, money_fmt)
+
+        def write_num(row: int, col: int, value: object) -> None:
+            # NULL → célula vazia sem formato, que ws.write também não grava.
+            if value is not None:
+                write_number(row, col, value)
+
+        # Writer por coluna resolvido uma vez: o laço por célula só despacha, sem testar
+        # se a coluna é monetária a cada valor. Colunas numéricas no DuckDB vão direto para
+        # write_number (sem a detecção de tipo do ws.write); texto segue por ws.write.
+        writers = [
+            write_money if c in monetary else write_num if c in numeric else write
+            for c in columns
+        ]
+
         cur = con.execute(f'SELECT * FROM "{result_table}"')
         row_idx = 0
         while True:
@@ -65,20 +97,18 @@ def export_resultado_xlsx(
                 break
             for record in batch:
                 row_idx += 1
-                for col, value in enumerate(record):
-                    if col in money_idx:
-                        num = _as_number(value)
-                        if num is None:
-                            ws.write(row_idx, col, value)
-                        else:
-                            ws.write_number(row_idx, col, num, money_fmt)
-                    else:
-                        ws.write(row_idx, col, value)
+                for col, (writer, value) in enumerate(zip(writers, record)):
+                    writer(row_idx, col, value)
         return row_idx
     finally:
         wb.close()
 
 
+def _is_numeric_type(type_name: str) -> bool:
+    """Tipo DuckDB cujos valores chegam ao Python como int/float/Decimal."""
+    return type_name in _NUMERIC_TYPES or type_name.startswith("DECIMAL")
+
+
 def _as_number(value: object) -> float | None:
     if value is None:
         return None
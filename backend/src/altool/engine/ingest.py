@@ -13,15 +13,23 @@ a normalização vírgula→ponto que os dados reais exigem (ex.: "2790022,95").
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import duckdb
 
 from ..domain.columns import sanitize_column_name
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 # Linha máxima do formato xlsx (limite do Excel).
 _XLSX_MAX_ROW = 1_048_576
+# Extensões que o dispatcher manda para o calamine.
+_CALAMINE_EXTS = (".xlsb", ".xls")
 
 
 def col_letter(n: int) -> str:
@@ -143,40 +151,85 @@ def ingest_calamine(
     (a v1 usa pyxlsb pelo mesmo motivo). Fidelidade de formatação de float em células
     numéricas de xlsb é questão de oráculo (Fase 4).
     """
+    return load_parsed(con, read_calamine(path, spec), table)
+
+
+@dataclass(frozen=True)
+class ParsedSheet:
+    """Planilha lida pelo calamine e já colunarizada, pronta para `load_parsed`."""
+
+    mapping: list[tuple[str, str]]  # [(excel_name, sqlite_name)]
+    arrow: pa.Table
+
+
+def read_calamine(path: str, spec: IngestSpec) -> ParsedSheet:
+    """Parse + colunarização (CPU puro, sem DuckDB): pode rodar fora do lock do DuckDBStore."""
     import pyarrow as pa
+
+    rows = _calamine_rows(path, spec)
+    header = _calamine_header(rows, spec, path)
+    sidx = spec.start_col - 1
+    n_cols = len(header)
+    sanitized = _sanitize_unique(list(header), spec.start_col)
+
+    # Recorte + padding por linha e transposição via zip(*) (em C); a conversão roda por
+    # coluna — nada de indexação/len por célula no laço Python. As linhas vêm do iterador
+    # (já depois do cabeçalho): cada linha completa é descartada assim que recortada, sem
+    # manter a planilha inteira como lista de listas ao lado das colunas.
+    end = sidx + n_cols
+    windows = [
+        w if len(w) == n_cols else w + [None] * (n_cols - len(w))
+        for w in (row[sidx:end] for row in rows)
+    ]
+    columns = zip(*windows) if windows else ((),) * n_cols
+    arrow = pa.table(
+        {
+            name: pa.array(_column_str(col), type=pa.string())
+            for name, col in zip(sanitized, columns)
+        }
+    )
+    return ParsedSheet(mapping=list(zip(header, sanitized)), arrow=arrow)
+
+
+def load_parsed(con: duckdb.DuckDBPyConnection, parsed: ParsedSheet, table: str) -> int:
+    """Materializa um `ParsedSheet` na tabela `table`. Retorna o número de linhas."""
+    con.execute(f'DROP TABLE IF EXISTS "{table}"')
+    con.register("_ingest_arrow", parsed.arrow)
+    con.execute(f'CREATE TABLE "{table}" AS SELECT * FROM _ingest_arrow')
+    con.unregister("_ingest_arrow")
+    return con.execute(f'SELECT count(*) FROM "{table}"').fetchone()[0]  # type: ignore[index]
+
+
+def _calamine_rows(path: str, spec: IngestSpec) -> Iterator[list[Any]]:
+    """Linhas da planilha sob demanda, no mesmo recorte de `to_python()` (a partir da
+    primeira linha não vazia) — sem materializar a planilha inteira em objetos Python."""
     import python_calamine as pc
 
     wb = pc.load_workbook(path)
     sheet = wb.get_sheet_by_name(spec.sheet) if spec.sheet else wb.get_sheet_by_index(0)
-    data = sheet.to_python()
-    hidx = spec.header_row - 1
-    sidx = spec.start_col - 1
-    if hidx >= len(data):
-        raise ValueError(f"header_row {spec.header_row} além do fim da planilha ({path})")
+    start = sheet.start  # None em planilha vazia
+    return islice(sheet.iter_rows(), start[0] if start else 0, None)
+
+
+def _calamine_header(rows: Iterator[list[Any]], spec: IngestSpec, path: str) -> list[str]:
+    """Cabeçalho (texto) a partir de start_col, sem as colunas vazias do final.
 
-    header = data[hidx][sidx:]
+    Consome `rows` até a linha do cabeçalho (inclusive); o restante são os dados.
+    """
+    row = next(islice(rows, spec.header_row - 1, None), None)
+    if row is None:
+        raise ValueError(f"header_row {spec.header_row} além do fim da planilha ({path})")
+    header = row[spec.start_col - 1 :]
     while header and _cell_str(header[-1]) in (None, ""):
         header.pop()
     if not header:
         raise ValueError(f"nenhuma coluna detectada no cabeçalho ({path})")
-    n_cols = len(header)
-    sanitized = _sanitize_unique([_cell_str(h) or "" for h in header], spec.start_col)
+    return [_cell_str(h) or "" for h in header]
 
-    columns: list[list[str | None]] = [[] for _ in range(n_cols)]
-    for row in data[hidx + 1 :]:
-        window = row[sidx : sidx + n_cols]
-        for i in range(n_cols):
-            cell = window[i] if i < len(window) else None
-            columns[i].append(_cell_str(cell))
 
-    arrow = pa.table(
-        {name: pa.array(columns[i], type=pa.string()) for i, name in enumerate(sanitized)}
-    )
-    con.execute(f'DROP TABLE IF EXISTS "{table}"')
-    con.register("_ingest_arrow", arrow)
-    con.execute(f'CREATE TABLE "{table}" AS SELECT * FROM _ingest_arrow')
-    con.unregister("_ingest_arrow")
-    return con.execute(f'SELECT count(*) FROM "{table}"').fetchone()[0]  # type: ignore[index]
+def is_calamine_format(path: str) -> bool:
+    """Formatos lidos pelo calamine no dispatcher (`ingest`)."""
+    return Path(path).suffix.lower() in _CALAMINE_EXTS
 
 
 def ingest(con: duckdb.DuckDBPyConnection, path: str, table: str, spec: IngestSpec) -> int:
@@ -184,7 +237,7 @@ def ingest(con: duckdb.DuckDBPyConnection, path: str, table: str, spec: IngestSp
     ext = Path(path).suffix.lower()
     if ext == ".xlsx":
         return ingest_xlsx(con, path, table, spec)
-    if ext in (".xlsb", ".xls"):
+    if ext in _CALAMINE_EXTS:
         return ingest_calamine(con, path, table, spec)
     if ext in (".csv", ".txt"):
         return ingest_csv(con, path, table, spec)
@@ -209,29 +262,45 @@ def column_mapping(
         vals = list(row)[spec.start_col - 1 :] if row else []
         originals = [("" if v is None else str(v)) for v in vals]
         return list(zip(originals, _sanitize_unique(list(originals), spec.start_col)))
-    if ext in (".xlsb", ".xls"):
-        import python_calamine as pc
-
-        wb = pc.load_workbook(path)
-        sheet = wb.get_sheet_by_name(spec.sheet) if spec.sheet else wb.get_sheet_by_index(0)
-        data = sheet.to_python()
-        header = data[spec.header_row - 1][spec.start_col - 1 :]
-        while header and _cell_str(header[-1]) in (None, ""):
-            header.pop()
-        originals = [_cell_str(h) or "" for h in header]
+    if ext in _CALAMINE_EXTS:
+        originals = _calamine_header(_calamine_rows(path, spec), spec, path)
         return list(zip(originals, _sanitize_unique(list(originals), spec.start_col)))
     raise ValueError(f"formato não suportado: {ext} ({path})")
 
 
+# Texto pronto dos inteiros pequenos (códigos, quantidades, flags 0/1): o calamine entrega
+# números como float, e `1.0` acha a chave `1` (mesmo hash/igualdade) sem is_integer/int/str.
+_SMALL_NUM_STR: dict[float, str] = {i: str(i) for i in range(-1, 4096)}
+
+
+def _float_str(value: float) -> str:
+    cached = _SMALL_NUM_STR.get(value)
+    if cached is not None:
+        return cached
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+# Conversão por tipo exato das células do calamine: um lookup por célula em vez da cadeia
+# de isinstance. bool tem entrada própria (não cai em int). Tipos fora da tabela
+# (datetime, date, time, timedelta) usam str().
+_CELL_STR: dict[type, Callable[[Any], str | None]] = {
+    str: lambda v: v,
+    float: _float_str,
+    int: str,
+    bool: lambda v: "TRUE" if v else "FALSE",
+    type(None): lambda v: None,
+}
+
+
 def _cell_str(value: object) -> str | None:
     """Converte célula do calamine em texto (all_varchar). None permanece NULL."""
-    if value is None:
-        return None
-    if isinstance(value, bool):
-        return "TRUE" if value else "FALSE"
-    if isinstance(value, float):
-        return str(int(value)) if value.is_integer() else repr(value)
-    return str(value)
+    conv = _CELL_STR.get(type(value))
+    return conv(value) if conv is not None else str(value)
+
+
+def _column_str(col: Iterable[object]) -> list[str | None]:
+    """`_cell_str` de uma coluna; texto e vazio (a maioria) passam direto, sem a chamada."""
+    return [v if v is None or v.__class__ is str else _cell_str(v) for v in col]
 
 
 def _sanitize_unique(names: list[str | None], start_col: int) -> list[str]:
@@ -141,18 +141,11 @@ def estorno_marks(
         for a_id, b_id in _match_pairs(list_a, list_b, cfg.limite_zero):
             paired_ids.add(a_id)
             paired_ids.add(b_id)
-        for e in list_a:
-            if not e.paired:
-                unpaired_ids.add(e.id)
-        for e in list_b:
-            if not e.paired:
-                unpaired_ids.add(e.id)
-
-    marks: dict[int, tuple[str, str]] = {}
-    for rid in unpaired_ids:
-        marks[rid] = (STATUS_NAO_AVALIADO, GROUP_DOC_ESTORNADOS)
-    for rid in paired_ids:  # pareamento vence
-        marks[rid] = (STATUS_CONCILIADO, GROUP_ESTORNO)
+        unpaired_ids.update([e.id for e in list_a if not e.paired])
+        unpaired_ids.update([e.id for e in list_b if not e.paired])
+
+    marks = dict.fromkeys(unpaired_ids, (STATUS_NAO_AVALIADO, GROUP_DOC_ESTORNADOS))
+    marks.update(dict.fromkeys(paired_ids, (STATUS_CONCILIADO, GROUP_ESTORNO)))  # pareamento vence
     return marks
 
 
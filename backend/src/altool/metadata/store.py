@@ -6,6 +6,8 @@ as migrações da v1. Bootstrap idempotente via DDL `CREATE TABLE IF NOT EXISTS`
 
 Conexão única persistente (check_same_thread=False + lock): adequado a um sidecar local
 single-user, evita overhead por-request e funciona com `:memory:` compartilhado nos testes.
+Autocommit no driver (isolation_level=None): as transações são só as de `tx()`, abertas com
+BEGIN IMMEDIATE explícito — sem o BEGIN implícito do módulo sqlite3 antes de cada DML.
 """
 
 from __future__ import annotations
@@ -265,14 +267,36 @@ _SCHEMA: tuple[str, ...] = (
 )
 
 
+def _tuning_pragmas() -> tuple[str, ...]:
+    """PRAGMAs de desempenho (perfil WAL recomendado), ajustáveis por env.
+
+    synchronous=NORMAL é seguro em WAL (perde no máximo o último commit num crash de SO);
+    cache_size negativo é em KiB.
+    """
+    env = os.environ.get
+    return (
+        f"PRAGMA synchronous={env('SQLITE_SYNCHRONOUS', 'NORMAL')}",
+        f"PRAGMA temp_store={env('SQLITE_TEMP_STORE', 'MEMORY')}",
+        f"PRAGMA cache_size=-{int(env('SQLITE_CACHE_KB', '64000'))}",
+        f"PRAGMA mmap_size={int(env('SQLITE_MMAP_BYTES', str(256 * 1024 * 1024)))}",
+        f"PRAGMA wal_autocheckpoint={int(env('SQLITE_WAL_AUTOCHECKPOINT', '1000'))}",
+    )
+
+
 class MetadataStore:
     """Acesso ao SQLite de metadados. Uma conexão persistente por instância."""
 
     def __init__(self, db_path: str | os.PathLike[str]) -> None:
         self._path = str(db_path)
         self._lock = threading.RLock()
-        self._con = sqlite3.connect(self._path, timeout=60.0, check_same_thread=False)
+        # Cache de statements maior que o default (128): o schema tem muitas tabelas e cada
+        # service tem seu SQL fixo — assim tudo fica compilado na conexão persistente.
+        self._con = sqlite3.connect(
+            self._path, timeout=60.0, check_same_thread=False, cached_statements=512,
+            isolation_level=None,
+        )
         self._con.row_factory = sqlite3.Row
+        self._depth = 0  # tx() aninhado entra na transação de fora
 
     @property
     def path(self) -> str:
@@ -281,24 +305,56 @@ class MetadataStore:
     def bootstrap(self) -> None:
         """Cria as tabelas (idempotente) e aplica PRAGMAs."""
         with self._lock:
-            if self._path != ":memory:":
+            # WAL é persistente no header do arquivo: só troca (escrita no header) se ainda
+            # não estiver; os demais PRAGMAs abaixo são por conexão.
+            if self._path != ":memory:" and self._journal_mode() != "wal":
                 self._con.execute("PRAGMA journal_mode=WAL")
             self._con.execute("PRAGMA busy_timeout=60000")
             self._con.execute("PRAGMA foreign_keys=ON")
-            for ddl in _SCHEMA:
-                self._con.execute(ddl)
-            self._con.commit()
+            for pragma in _tuning_pragmas():
+                self._con.execute(pragma)
+            with self.tx() as con:
+                for ddl in _SCHEMA:
+                    con.execute(ddl)
+            # Conexão de vida longa: deixa o SQLite decidir quais índices analisar (0x10002 =
+            # limita o ANALYZE ao que ainda não tem estatística). Depois, `optimize()` periódico.
+            self._con.execute("PRAGMA optimize=0x10002")
+
+    def _journal_mode(self) -> str:
+        return str(self._con.execute("PRAGMA journal_mode").fetchone()[0]).lower()
+
+    def optimize(self) -> None:
+        """`PRAGMA optimize` — barato; chamado periodicamente pelo worker e no shutdown."""
+        with self._lock:
+            self._con.execute("PRAGMA optimize")
 
     @contextmanager
     def tx(self) -> Iterator[sqlite3.Connection]:
-        """Transação serializada: commit no fim, rollback em erro."""
+        """Transação serializada (BEGIN IMMEDIATE): commit no fim, rollback em erro.
+
+        Reentrante: um `tx()` dentro de outro participa da transação externa.
+        """
         with self._lock:
+            if self._depth:
+                self._depth += 1
+                try:
+                    yield self._con
+                finally:
+                    self._depth -= 1
+                return
+            self._con.execute("BEGIN IMMEDIATE")
+            self._depth = 1
             try:
                 yield self._con
-                self._con.commit()
-            except Exception:
-                self._con.rollback()
+                self._con.execute("COMMIT")
+            except BaseException:
+                # O SQLite pode já ter desfeito a transação (FULL/IOERR/interrupt): um ROLLBACK
+                # sem transação levantaria e esconderia o erro original.
+                if self._con.in_transaction:
+                    self._con.execute("ROLLBACK")
                 raise
+            finally:
+                self._depth = 0
 
     def query_one(self, sql: str, params: tuple[object, ...] = ()) -> sqlite3.Row | None:
         with self._lock:
@@ -8,7 +8,6 @@ Fluxo em DOIS passos (fiel à v1): POST /runs cria o run (status CREATED, não r
 from __future__ import annotations
 
 import json
-import os
 from math import ceil
 from pathlib import Path
 from typing import Any
@@ -17,19 +16,15 @@ from ..engine.atribuicao import AtribKey, AtribuicaoConfig, atribuir
 from ..engine.data_store import DuckDBStore
 from ..engine.export import export_resultado_xlsx
 from ..metadata.store import MetadataStore
+from .jobs import notify
 from .keys import KeysService
+from .paths import export_dir
 
 RUNS = "atribuicao_runs"
 _VALID_TIPOS = {"CONTABIL", "FISCAL"}
 _MEDIA_XLSX = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
 
 
-def _export_dir() -> Path:
-    d = Path(os.environ.get("EXPORT_DIR") or (Path(os.environ.get("DATA_DIR", ".")) / "exports"))
-    d.mkdir(parents=True, exist_ok=True)
-    return d
-
-
 class AtribuicaoService:
     def __init__(self, store: MetadataStore, data: DuckDBStore, keys: KeysService) -> None:
         self._store = store
@@ -87,6 +82,7 @@ class AtribuicaoService:
                 f"UPDATE {RUNS} SET status='PENDING', updated_at=datetime('now') WHERE id=?",
                 (run_id,),
             )
+        notify(self._store)
         return 200, {"runId": run_id, "status": "started"}
 
     # ------------------------------------------------------------------ process
@@ -202,6 +198,7 @@ class AtribuicaoService:
                 f"UPDATE {RUNS} SET export_status='PENDING', export_progress=0, "
                 "updated_at=datetime('now') WHERE id=?", (run_id,),
             )
+        notify(self._store)
         return 200, {"status": "processing", "message": "Exportação iniciada"}
 
     def process_export(self, export_row: Any) -> None:
@@ -210,7 +207,7 @@ class AtribuicaoService:
         if run is None:
             raise ValueError("run não encontrado")
         table = run.get("result_table_name") or f"atribuicao_result_{run_id}"
-        out_path = _export_dir() / f"atribuicao_{run_id}.xlsx"
+        out_path = export_dir() / f"atribuicao_{run_id}.xlsx"
         self._set_export(run_id, "RUNNING", 0)
         try:
             with self._data.use() as con:
@@ -12,9 +12,18 @@ from math import ceil
 from typing import Any
 
 from ..engine.data_store import DuckDBStore
-from ..engine.ingest import IngestSpec, column_mapping, ingest, numeric_sql
+from ..engine.ingest import (
+    IngestSpec,
+    column_mapping,
+    ingest,
+    is_calamine_format,
+    load_parsed,
+    numeric_sql,
+    read_calamine,
+)
 from ..metadata.store import MetadataStore
-from .jobs import enqueue_ingest, latest_ingest_job_for_base
+from .jobs import enqueue_ingest, latest_ingest_job_for_base, notify
+from .uploads import resolve_upload_path
 
 _ACTIVE = ("PENDING", "RUNNING")
 _DERIVED_SYNC_MAX = 10_000  # acima disso, derivação vira job assíncrono (igual à v1)
@@ -108,17 +117,25 @@ class BasesService:
         base = self._store.query_one("SELECT * FROM bases WHERE id = ?", (base_id,))
         if base is None:
             raise ValueError(f"base {base_id} não encontrada")
-        path = base["arquivo_caminho"]
-        if not path:
+        if not base["arquivo_caminho"]:
             raise ValueError(f"base {base_id} sem arquivo_caminho")
+        path = resolve_upload_path(base["arquivo_caminho"])
         spec = IngestSpec(
             header_row=int(base["header_linha_inicial"] or 1),
             start_col=int(base["header_coluna_inicial"] or 1),
         )
         table = f"base_{base_id}"
-        with self._data.use() as con:
-            mapping = column_mapping(con, path, spec)
-            ingest(con, path, table, spec)
+        if is_calamine_format(path):
+            # O calamine lê a planilha inteira: cabeçalho e dados saem de UMA carga. O parse
+            # é CPU puro e fica fora do lock do DuckDB para sobrepor com outros jobs.
+            parsed = read_calamine(path, spec)
+            mapping = parsed.mapping
+            with self._data.use() as con:
+                load_parsed(con, parsed, table)
+        else:
+            with self._data.use() as con:
+                mapping = column_mapping(con, path, spec)
+                ingest(con, path, table, spec)
         with self._store.tx() as con:
             con.execute("DELETE FROM base_columns WHERE base_id = ?", (base_id,))
             for idx, (excel, sqlite_name) in enumerate(mapping):
@@ -210,6 +227,7 @@ class BasesService:
                     (base_id, source_column, op, rows),
                 )
                 job_id = int(cur.lastrowid or 0)
+            notify(self._store)
             return {"success": True, "background": True, "jobId": job_id, "rowCount": rows,
                     "message": "Derivação enfileirada"}
         target = self._apply_derived(base_id, base["tabela_sqlite"], source_column, op)
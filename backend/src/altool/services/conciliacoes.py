@@ -7,7 +7,6 @@ por polling. `process` é o processador chamado pelo JobWorker.
 
 from __future__ import annotations
 
-import os
 from math import ceil
 from pathlib import Path
 from typing import Any
@@ -18,6 +17,8 @@ from ..engine.export import export_resultado_xlsx
 from ..engine.pipeline import CancelamentoConfig, EstornoConfig, run_conciliacao
 from ..metadata.store import MetadataStore
 from .configs import ConfigsService
+from .jobs import notify
+from .paths import export_dir
 
 TABLE = "jobs_conciliacao"
 
@@ -27,12 +28,6 @@ _MEDIA = {
 }
 
 
-def _export_dir() -> Path:
-    d = Path(os.environ.get("EXPORT_DIR") or (Path(os.environ.get("DATA_DIR", ".")) / "exports"))
-    d.mkdir(parents=True, exist_ok=True)
-    return d
-
-
 class ConciliacaoService:
     def __init__(self, store: MetadataStore, data: DuckDBStore, configs: ConfigsService) -> None:
         self._store = store
@@ -58,6 +53,7 @@ class ConciliacaoService:
                  _int_or_none(body.get("baseFiscalId"))),
             )
             jid = int(cur.lastrowid or 0)
+        notify(self._store)
         return self._job(jid)  # type: ignore[return-value]
 
     # ------------------------------------------------------------------ process
@@ -182,6 +178,7 @@ class ConciliacaoService:
                 f"UPDATE {TABLE} SET export_status='PENDING', export_progress=0, "
                 "updated_at=datetime('now') WHERE id=?", (job_id,),
             )
+        notify(self._store)
         return 202, {"jobId": export_job_id, "status": "export_started"}
 
     def process_export(self, export_row: Any) -> None:
@@ -191,7 +188,7 @@ class ConciliacaoService:
         if job is None:
             raise ValueError("job de conciliação não encontrado")
         table = job.get("result_table_name") or f"conciliacao_result_{job_id}"
-        out_path = _export_dir() / f"conciliacao_{job_id}.xlsx"
+        out_path = export_dir() / f"conciliacao_{job_id}.xlsx"
         self._set_export(job_id, "RUNNING", 0)
         try:
             with self._data.use() as con:
@@ -6,18 +6,56 @@ DONE/FAILED). O claim é serializado pelo lock do MetadataStore (sidecar local s
 `process_pending_once(store, table, process)` roda UM job de forma síncrona (testes
 determinísticos); `JobWorker` drena várias filas em background. O `process` recebe a linha
 do job e faz o trabalho, levantando exceção em erro.
+
+Quem enfileira chama `notify(store)` após o commit: o worker dorme num Event em vez de
+varrer as filas a cada tick; o `poll_interval` vira só rede de segurança.
 """
 
 from __future__ import annotations
 
+import random
 import sqlite3
 import threading
-from typing import Callable, Sequence
+import weakref
+from functools import cache
+from typing import Callable, NamedTuple, Sequence
 
 from ..metadata.store import MetadataStore
 
 JobProcessor = Callable[[sqlite3.Row], None]
 
+# A conexão do MetadataStore vive o processo todo; a cada N ciclos ociosos do worker
+# roda `PRAGMA optimize` para manter as estatísticas do planner em dia.
+_OPTIMIZE_EVERY = 1000
+
+# Teto do texto de erro gravado no job: mensagens do DuckDB/calamine podem embutir SQL ou
+# linhas inteiras; o `erro` vai para o SQLite e é devolvido a cada polling do frontend.
+_MAX_ERRO = 64 * 1024
+
+# `erro` dos jobs que estavam RUNNING quando o processo anterior morreu.
+_ERRO_ORFAO = "interrompido: sidecar reiniciado"
+
+# Backoff (s) quando o SQLite responde OperationalError no claim/mark.
+_BACKOFF_START = 0.05
+_BACKOFF_MAX = 5.0
+
+# Um Event de "há job novo" por store (API e worker vivem no mesmo processo).
+_wakeups: weakref.WeakKeyDictionary[MetadataStore, threading.Event] = weakref.WeakKeyDictionary()
+_wakeups_lock = threading.Lock()
+
+
+def _wakeup(store: MetadataStore) -> threading.Event:
+    with _wakeups_lock:
+        event = _wakeups.get(store)
+        if event is None:
+            event = _wakeups[store] = threading.Event()
+        return event
+
+
+def notify(store: MetadataStore) -> None:
+    """Acorda o worker de `store`. Chamar depois do commit que deixou um job PENDING."""
+    _wakeup(store).set()
+
 
 # --------------------------------------------------------------- fila genérica
 
@@ -33,38 +71,80 @@ def latest_job(
     )
 
 
-def _claim_next(store: MetadataStore, table: str) -> sqlite3.Row | None:
+class _JobSQL(NamedTuple):
+    claim: str
+    mark: str
+    orphans: str
+
+
+@cache
+def _sql(table: str) -> _JobSQL:
+    """SQL fixo por fila, montado uma vez: a mesma string reaproveita o statement
+    já compilado no cache do sqlite3 (sem re-parse/re-plan a cada job)."""
+    return _JobSQL(
+        claim=(
+            f"UPDATE {table} SET status='RUNNING', updated_at=datetime('now') "
+            f"WHERE id = (SELECT id FROM {table} WHERE status = 'PENDING' ORDER BY id LIMIT 1) "
+            "RETURNING *"
+        ),
+        mark=f"UPDATE {table} SET status=?, erro=?, updated_at=datetime('now') WHERE id=?",
+        orphans=(
+            f"UPDATE {table} SET status='FAILED', erro=?, updated_at=datetime('now') "
+            "WHERE status='RUNNING'"
+        ),
+    )
+
+
+def claim_next(store: MetadataStore, table: str) -> sqlite3.Row | None:
+    """Claima o job PENDING mais antigo num único UPDATE … RETURNING (já como RUNNING).
+
+    Um job por claim: só fica RUNNING o que vai rodar agora — a UI não mostra como em
+    execução jobs ainda na fila, e com várias threads cada uma pega o seu.
+    """
     with store.tx() as con:
-        row = con.execute(
-            f"SELECT * FROM {table} WHERE status = 'PENDING' ORDER BY id LIMIT 1"
-        ).fetchone()
-        if row is None:
-            return None
-        con.execute(
-            f"UPDATE {table} SET status='RUNNING', updated_at=datetime('now') WHERE id=?",
-            (row["id"],),
-        )
-        return row
+        row: sqlite3.Row | None = con.execute(_sql(table).claim).fetchone()
+    return row
+
+
+def fail_orphans(store: MetadataStore, table: str) -> int:
+    """Marca FAILED todo job RUNNING de `table`. Só é seguro sem worker rodando (ex.: na
+    subida): são jobs órfãos de um processo que morreu no meio.
+
+    Não recoloca na fila: se o próprio job derrubou o processo (ex.: OOM no parse de uma
+    planilha grande), rodá-lo de novo na subida derrubaria o sidecar em loop. O usuário vê o
+    erro e decide reprocessar.
+    """
+    with store.tx() as con:
+        return con.execute(_sql(table).orphans, (_ERRO_ORFAO,)).rowcount
 
 
 def mark(store: MetadataStore, table: str, job_id: int, status: str, erro: str | None = None) -> None:
     with store.tx() as con:
-        con.execute(
-            f"UPDATE {table} SET status=?, erro=?, updated_at=datetime('now') WHERE id=?",
-            (status, erro, job_id),
-        )
+        con.execute(_sql(table).mark, (status, erro, job_id))
 
 
-def process_pending_once(store: MetadataStore, table: str, process: JobProcessor) -> bool:
-    """Processa UM job pendente de `table`. Retorna True se processou algo."""
-    job = _claim_next(store, table)
-    if job is None:
-        return False
+def run_job(store: MetadataStore, table: str, process: JobProcessor, job: sqlite3.Row) -> None:
+    """Roda um job já claimado e grava DONE/FAILED."""
     try:
         process(job)
         mark(store, table, int(job["id"]), "DONE")
     except Exception as e:
-        mark(store, table, int(job["id"]), "FAILED", str(e) or "erro")
+        mark(store, table, int(job["id"]), "FAILED", _erro_text(e))
+
+
+def _erro_text(e: BaseException) -> str:
+    text = str(e) or "erro"
+    if len(text) <= _MAX_ERRO:
+        return text
+    return text[:_MAX_ERRO] + f"… [truncado: {len(text) - _MAX_ERRO} caracteres]"
+
+
+def process_pending_once(store: MetadataStore, table: str, process: JobProcessor) -> bool:
+    """Processa UM job pendente de `table`. Retorna True se processou algo."""
+    job = claim_next(store, table)
+    if job is None:
+        return False
+    run_job(store, table, process, job)
     return True
 
 
@@ -75,7 +155,9 @@ def enqueue_ingest(store: MetadataStore, base_id: int) -> int:
         cur = con.execute(
             "INSERT INTO ingest_jobs (base_id, status) VALUES (?, 'PENDING')", (base_id,)
         )
-        return int(cur.lastrowid or 0)
+        job_id = int(cur.lastrowid or 0)
+    notify(store)
+    return job_id
 
 
 def get_ingest_job(store: MetadataStore, job_id: int) -> sqlite3.Row | None:
@@ -89,40 +171,96 @@ def latest_ingest_job_for_base(store: MetadataStore, base_id: int) -> sqlite3.Ro
 # --------------------------------------------------------------- worker
 
 class JobWorker:
-    """Thread que drena uma ou mais filas em background."""
+    """Threads que drenam uma ou mais filas em background.
+
+    `concurrency` > 1 sobe N threads sobre as mesmas filas (o claim é atômico). O acesso ao
+    DuckDB continua serializado pelo DuckDBStore; o ganho vem só do trabalho fora do lock —
+    hoje o parse de xlsb/xls (`read_calamine`) — sobrepondo com o SQL de outro job. A
+    escrita dos exports XLSX roda dentro do lock e não sobrepõe.
+
+    Custos de ligar (padrão do app é 1): jobs antes estritamente sequenciais passam a
+    intercalar (ex.: ingest/coluna derivada de uma base enquanto uma conciliação a lê), e
+    dois parses calamine simultâneos mantêm as duas tabelas Arrow na memória do Python, fora
+    do `memory_limit` do DuckDB.
+    """
 
     def __init__(
         self,
         store: MetadataStore,
         handlers: Sequence[tuple[str, JobProcessor]],
         *,
-        poll_interval: float = 0.5,
+        poll_interval: float = 5.0,
+        concurrency: int = 1,
     ) -> None:
         self._store = store
         self._handlers = list(handlers)
         self._poll = poll_interval
+        self._concurrency = max(1, concurrency)
         self._stop = threading.Event()
-        self._thread: threading.Thread | None = None
+        self._wake = _wakeup(store)
+        self._threads: list[threading.Thread] = []
+
+    @property
+    def concurrency(self) -> int:
+        return self._concurrency
 
     def start(self) -> None:
-        if self._thread and self._thread.is_alive():
+        if any(t.is_alive() for t in self._threads):
             return
         self._stop.clear()
-        self._thread = threading.Thread(target=self._run, name="job-worker", daemon=True)
-        self._thread.start()
+        for table, _ in self._handlers:
+            fail_orphans(self._store, table)
+        self._threads = [
+            threading.Thread(target=self._run, name=f"job-worker-{i}", daemon=True)
+            for i in range(self._concurrency)
+        ]
+        for t in self._threads:
+            t.start()
 
     def _run(self) -> None:
+        idle = 0
+        backoff = _BACKOFF_START
         while not self._stop.is_set():
-            did = False
+            # Limpa ANTES de varrer: um notify durante a varredura não se perde.
+            self._wake.clear()
+            did = busy = False
             for table, process in self._handlers:
                 try:
-                    did = process_pending_once(self._store, table, process) or did
+                    did = self._run_next(table, process) or did
+                except sqlite3.OperationalError:
+                    busy = True  # ex.: database is locked (checkpoint, processo externo)
                 except Exception:
                     pass
+            if busy:
+                # Retry curto com backoff exponencial + jitter, em vez de esperar o poll.
+                self._wake.wait(backoff * (0.5 + random.random()))
+                backoff = min(backoff * 2, _BACKOFF_MAX)
+                continue
+            backoff = _BACKOFF_START
             if not did:
-                self._stop.wait(self._poll)
+                idle += 1
+                if idle % _OPTIMIZE_EVERY == 0:
+                    self._optimize()
+                self._wake.wait(self._poll)
+
+    def _run_next(self, table: str, process: JobProcessor) -> bool:
+        if self._stop.is_set():
+            return False  # parando: não claima mais nada
+        job = claim_next(self._store, table)
+        if job is None:
+            return False
+        run_job(self._store, table, process, job)
+        return True
+
+    def _optimize(self) -> None:
+        try:
+            self._store.optimize()
+        except sqlite3.Error:
+            pass
 
     def stop(self) -> None:
         self._stop.set()
-        if self._thread:
-            self._thread.join(timeout=2.0)
+        self._wake.set()
+        for t in self._threads:
+            t.join(timeout=2.0)
+        self._optimize()
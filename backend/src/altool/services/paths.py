@@ -0,0 +1,26 @@
+"""Diretórios de storage do sidecar (uploads, exports) a partir do ambiente.
+
+Resolvidos e criados (`mkdir -p`) a cada chamada: se o usuário apagar a pasta de dados com o
+sidecar no ar, o próximo upload/export recria o diretório.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+
+def upload_dir() -> Path:
+    """UPLOAD_DIR ou DATA_DIR/uploads (criado se não existir)."""
+    return _ensure_dir(os.environ.get("UPLOAD_DIR", ""), os.environ.get("DATA_DIR", "."), "uploads")
+
+
+def export_dir() -> Path:
+    """EXPORT_DIR ou DATA_DIR/exports (criado se não existir)."""
+    return _ensure_dir(os.environ.get("EXPORT_DIR", ""), os.environ.get("DATA_DIR", "."), "exports")
+
+
+def _ensure_dir(explicit: str, data_dir: str, default_name: str) -> Path:
+    d = Path(explicit) if explicit else Path(data_dir) / default_name
+    d.mkdir(parents=True, exist_ok=True)
+    return d
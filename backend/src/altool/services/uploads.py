@@ -0,0 +1,118 @@
+"""Uploads — resolução de `bases.arquivo_caminho` para um arquivo existente.
+
+O caminho gravado na base nem sempre existe como está: bases vindas da v1 guardam caminhos
+relativos (`uploads/<arquivo>`), e o DATA_DIR do app empacotado pode mudar de lugar. A
+resolução tenta primeiro o índice por nome do(s) diretório(s) de upload (um `scandir` por
+mudança de mtime, não um `stat` por candidato) e só então os candidatos relativos.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Iterator
+from functools import lru_cache
+
+
+def _prefixes() -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """(dirs de upload, raízes para caminho relativo) do ambiente atual."""
+    return _prefixes_for(
+        os.environ.get("DATA_DIR", "."), os.environ.get("UPLOAD_DIR", ""), os.getcwd()
+    )
+
+
+@lru_cache(maxsize=8)
+def _prefixes_for(
+    data_dir: str, upload_env: str, cwd: str
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Calculado uma vez por ambiente: absolutos, sem duplicatas; as raízes já com o
+    separador no fim para montar candidatos por concatenação simples."""
+    dirs: list[str] = []
+    for d in (upload_env, os.path.join(data_dir, "uploads")):
+        if d and os.path.abspath(d) not in dirs:
+            dirs.append(os.path.abspath(d))
+    roots: list[str] = []
+    for r in (data_dir, *dirs, cwd):
+        prefix = os.path.join(os.path.abspath(r), "")
+        if prefix not in roots:
+            roots.append(prefix)
+    return tuple(dirs), tuple(roots)
+
+
+class _DirIndex:
+    """nome do arquivo → caminho, por diretório; refeito só quando o mtime do dir muda.
+
+    Limitado a `max_dirs` diretórios (descarta o mais antigo) — a resolução só consulta
+    os dirs de upload e os pais dos candidatos.
+    """
+
+    def __init__(self, max_dirs: int = 64) -> None:
+        self._lock = threading.Lock()
+        self._max = max_dirs
+        self._dirs: dict[str, tuple[float, dict[str, str]]] = {}
+
+    def entries(self, directory: str) -> dict[str, str]:
+        try:
+            mtime = os.stat(directory).st_mtime
+        except OSError:
+            return {}
+        with self._lock:
+            cached = self._dirs.get(directory)
+            if cached is None or cached[0] != mtime:
+                try:
+                    with os.scandir(directory) as it:
+                        found = {e.name: e.path for e in it if e.is_file()}
+                except OSError:
+                    return {}
+                self._dirs.pop(directory, None)
+                if len(self._dirs) >= self._max:
+                    self._dirs.pop(next(iter(self._dirs)))
+                cached = self._dirs[directory] = (mtime, found)
+            return cached[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._dirs.clear()
+
+
+_index = _DirIndex()
+
+
+def resolve_upload_path(arquivo_caminho: str) -> str:
+    """Resolve o caminho gravado na base para um arquivo existente.
+
+    Ordem: caminho absoluto existente (caso comum: gravado pelo upload da v2) → nome do
+    arquivo no índice dos diretórios de upload → o caminho como está → relativo a
+    DATA_DIR / UPLOAD_DIR / cwd. Levanta FileNotFoundError com os candidatos.
+
+    Existência é checada contra o índice do diretório pai (um `scandir` por pai distinto,
+    reaproveitado entre jobs) em vez de um `stat` por candidato.
+    """
+    if os.path.isabs(arquivo_caminho) and os.path.isfile(arquivo_caminho):
+        return arquivo_caminho
+    cleaned = arquivo_caminho.strip().replace("\\", "/")
+    seen: set[str] = set()
+    tried: list[str] = []
+    for candidate in _candidates(cleaned):
+        if candidate in seen:
+            continue
+        seen.add(candidate)
+        tried.append(candidate)
+        parent, name = os.path.split(candidate)
+        if name in _index.entries(parent):
+            return candidate
+    raise FileNotFoundError(
+        f"arquivo da base não encontrado: {arquivo_caminho} (tentados: {', '.join(tried)})"
+    )
+
+
+def _candidates(cleaned: str) -> Iterator[str]:
+    """Candidatos em ordem de prioridade, gerados sob demanda (para no primeiro acerto)."""
+    dirs, roots = _prefixes()
+    name = os.path.basename(cleaned)
+    for d in dirs:
+        yield os.path.join(d, name)
+    yield os.path.abspath(cleaned)
+    if not os.path.isabs(cleaned):
+        for prefix in roots:
+            yield os.path.normpath(prefix + cleaned)
@@ -49,3 +49,16 @@ def test_export_formatacao_monetaria(tmp_path) -> None:  # type: ignore[no-untyp
     money_cell = ws.cell(row=2, column=vcol)
     assert money_cell.number_format == MONEY_FMT
     assert isinstance(money_cell.value, (int, float))  # escrito como número, não texto
+
+
+def test_export_colunas_numericas_e_nulls(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    con = duckdb.connect()
+    con.execute(
+        "CREATE TABLE r AS SELECT * FROM (VALUES (1, 2.5::DECIMAL(10,2), 'x'), "
+        "(NULL, NULL, NULL)) t(n, d, s)"
+    )
+    out = tmp_path / "n.xlsx"
+    assert export_resultado_xlsx(con, "r", str(out), monetary_cols=()) == 2
+    ws = openpyxl.load_workbook(out)["resultado"]
+    assert [c.value for c in ws[2]] == [1, 2.5, "x"]
+    assert [c.value for c in ws[3]] == [None, None, None]
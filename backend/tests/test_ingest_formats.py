@@ -6,15 +6,23 @@ ambos), então cobre a ingestão de xlsb sem precisar de um arquivo .xlsb.
 
 from __future__ import annotations
 
+import subprocess
+import sys
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
+from altool.engine import ingest as ingest_mod
 from altool.engine.db import connect
 from altool.engine.ingest import (
     IngestSpec,
+    column_mapping,
     ingest,
     ingest_calamine,
     ingest_csv,
+    load_parsed,
     numeric_sql,
+    read_calamine,
 )
 
 FX = Path(__file__).resolve().parent / "fixtures"
@@ -41,6 +49,49 @@ def test_ingest_calamine_xlsb_codepath() -> None:
     assert con.execute("SELECT empresa FROM t").fetchall() == [("TBRA",), ("TBRA",), ("ACME",)]
 
 
+def test_read_calamine_carrega_planilha_uma_vez(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    # .xlsb passa pelo calamine: header + dados devem sair de UMA única carga do arquivo.
+    real = ingest_mod._calamine_rows
+    loads: list[str] = []
+
+    def counting(path: str, spec: IngestSpec) -> Iterator[list[Any]]:
+        loads.append(path)
+        return real(str(FX / "sample.xlsx"), spec)
+
+    monkeypatch.setattr(ingest_mod, "_calamine_rows", counting)
+    parsed = read_calamine("/tmp/base.xlsb", IngestSpec(header_row=3))
+    assert load_parsed(connect(), parsed, "t") == 3
+    assert [m[1] for m in parsed.mapping] == COLS
+    assert loads == ["/tmp/base.xlsb"]
+
+
+def test_column_mapping_calamine_para_no_cabecalho(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    real = ingest_mod._calamine_rows
+    pulled: list[list[object]] = []
+
+    def tracking(path: str, spec: IngestSpec) -> Iterator[list[Any]]:
+        for row in real(str(FX / "sample.xlsx"), spec):
+            pulled.append(row)
+            yield row
+
+    monkeypatch.setattr(ingest_mod, "_calamine_rows", tracking)
+    mapping = column_mapping(connect(), "/tmp/base.xlsb", IngestSpec(header_row=3))
+    assert [m[1] for m in mapping] == COLS
+    assert len(pulled) == 3  # só as linhas até o cabeçalho, não os dados
+
+
+def test_cell_str_por_tipo() -> None:
+    import datetime as dt
+
+    cs = ingest_mod._cell_str
+    assert cs(None) is None
+    assert cs(True) == "TRUE" and cs(False) == "FALSE"  # bool não vira número
+    assert cs(1) == "1" and cs(2.0) == "2" and cs(2790022.95) == "2790022.95"
+    assert cs(-0.0) == "0" and cs(4095.5) == "4095.5" and cs(1e20) == "100000000000000000000"
+    assert cs("x") == "x"
+    assert cs(dt.date(2024, 1, 31)) == "2024-01-31"
+
+
 def test_dispatcher_formatos_convergem() -> None:
     con = connect()
     ingest(con, str(FX / "sample.csv"), "a", IngestSpec(header_row=1, start_col=1))
@@ -58,3 +109,17 @@ def test_dispatcher_formato_nao_suportado() -> None:
         raise AssertionError("deveria ter falhado")
     except ValueError as e:
         assert "não suportado" in str(e)
+
+
+def test_leitores_de_formato_sao_importados_sob_demanda() -> None:
+    # Boot do sidecar não paga pyarrow/calamine/xlsxwriter: só o job que usa importa.
+    code = (
+        "import sys, altool.services.bases, altool.services.conciliacoes, "
+        "altool.services.atribuicoes; "
+        "print(sorted(m for m in ('pyarrow', 'python_calamine', 'xlsxwriter', 'polars') "
+        "if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert out.strip() == "[]"
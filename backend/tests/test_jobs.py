@@ -0,0 +1,195 @@
+"""Fila genérica de jobs (SQLite) + JobWorker — sem DuckDB, só o MetadataStore."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+
+from altool.metadata.store import MetadataStore
+from altool.services import jobs
+from altool.services.jobs import (
+    JobWorker,
+    claim_next,
+    enqueue_ingest,
+    fail_orphans,
+    get_ingest_job,
+    process_pending_once,
+)
+
+
+def _store() -> MetadataStore:
+    store = MetadataStore(":memory:")
+    store.bootstrap()
+    return store
+
+
+def test_process_pending_once_done_e_failed() -> None:
+    store = _store()
+    ok = enqueue_ingest(store, 1)
+    bad = enqueue_ingest(store, 2)
+
+    def proc(row):  # type: ignore[no-untyped-def]
+        if row["base_id"] == 2:
+            raise ValueError("falhou")
+
+    assert process_pending_once(store, "ingest_jobs", proc) is True
+    assert process_pending_once(store, "ingest_jobs", proc) is True
+    assert process_pending_once(store, "ingest_jobs", proc) is False
+    assert get_ingest_job(store, ok)["status"] == "DONE"  # type: ignore[index]
+    failed = get_ingest_job(store, bad)
+    assert failed["status"] == "FAILED" and failed["erro"] == "falhou"  # type: ignore[index]
+
+
+def test_worker_drena_fila() -> None:
+    store = _store()
+    seen: list[int] = []
+    worker = JobWorker(
+        store, [("ingest_jobs", lambda r: seen.append(int(r["base_id"])))], poll_interval=0.01
+    )
+    worker.start()
+    try:
+        for bid in (1, 2, 3):
+            enqueue_ingest(store, bid)
+        deadline = time.time() + 5
+        while len(seen) < 3 and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        worker.stop()
+    assert seen == [1, 2, 3]
+
+
+def test_notify_acorda_worker_sem_esperar_o_poll() -> None:
+    store = _store()
+    seen: list[int] = []
+    worker = JobWorker(store, [("ingest_jobs", lambda r: seen.append(int(r["base_id"])))],
+                       poll_interval=60.0)
+    worker.start()
+    try:
+        time.sleep(0.05)  # worker já dormindo no Event
+        t0 = time.time()
+        enqueue_ingest(store, 7)  # enqueue_ingest chama notify()
+        while not seen and time.time() - t0 < 5:
+            time.sleep(0.01)
+    finally:
+        worker.stop()
+    assert seen == [7]
+    assert time.time() - t0 < 5
+
+
+def test_claim_next_claima_o_mais_antigo() -> None:
+    store = _store()
+    ids = [enqueue_ingest(store, bid) for bid in (10, 11)]
+    job = claim_next(store, "ingest_jobs")
+    assert job is not None and int(job["id"]) == ids[0] and job["status"] == "RUNNING"
+    assert get_ingest_job(store, ids[1])["status"] == "PENDING"  # type: ignore[index]
+    assert int(claim_next(store, "ingest_jobs")["id"]) == ids[1]  # type: ignore[index]
+    assert claim_next(store, "ingest_jobs") is None
+
+
+def test_worker_so_deixa_running_o_job_em_execucao() -> None:
+    store = _store()
+    running: list[int] = []
+
+    def proc(_row):  # type: ignore[no-untyped-def]
+        running.append(store.query_one(
+            "SELECT count(*) AS n FROM ingest_jobs WHERE status = 'RUNNING'")["n"])  # type: ignore[index]
+
+    for bid in (1, 2, 3):
+        enqueue_ingest(store, bid)
+    worker = JobWorker(store, [("ingest_jobs", proc)], poll_interval=0.01)
+    worker.start()
+    try:
+        deadline = time.time() + 5
+        while len(running) < 3 and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        worker.stop()
+    assert running == [1, 1, 1]  # os ainda não iniciados seguem PENDING na UI
+
+
+def test_worker_concorrente_roda_jobs_em_paralelo() -> None:
+    store = _store()
+    barrier = threading.Barrier(2, timeout=5)
+    done: list[int] = []
+
+    def proc(row):  # type: ignore[no-untyped-def]
+        barrier.wait()  # só passa se os 2 jobs estiverem rodando ao mesmo tempo
+        done.append(int(row["base_id"]))
+
+    worker = JobWorker(store, [("ingest_jobs", proc)], concurrency=2)  # batch padrão, como no app
+    worker.start()
+    try:
+        ids = [enqueue_ingest(store, bid) for bid in (1, 2)]
+        deadline = time.time() + 5
+        while len(done) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        worker.stop()
+    assert sorted(done) == [1, 2]
+    assert all(get_ingest_job(store, j)["status"] == "DONE" for j in ids)  # type: ignore[index]
+
+
+def test_erro_gigante_e_truncado() -> None:
+    store = _store()
+    jid = enqueue_ingest(store, 1)
+
+    def proc(_row):  # type: ignore[no-untyped-def]
+        raise ValueError("x" * 200_000)
+
+    process_pending_once(store, "ingest_jobs", proc)
+    erro = get_ingest_job(store, jid)["erro"]  # type: ignore[index]
+    assert erro.startswith("x" * 1000)
+    assert len(erro) < 70_000 and "truncado" in erro
+
+
+def test_worker_reage_a_db_locked_com_backoff_curto(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    store = _store()
+    real = jobs.claim_next
+    fails = {"n": 3}
+
+    def flaky(*args, **kwargs):  # type: ignore[no-untyped-def]
+        if fails["n"]:
+            fails["n"] -= 1
+            raise sqlite3.OperationalError("database is locked")
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(jobs, "claim_next", flaky)
+    enqueue_ingest(store, 5)
+    seen: list[int] = []
+    worker = JobWorker(store, [("ingest_jobs", lambda r: seen.append(int(r["base_id"])))],
+                       poll_interval=60.0)
+    worker.start()
+    try:
+        deadline = time.time() + 5
+        while not seen and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        worker.stop()
+    assert seen == [5]
+    assert fails["n"] == 0
+
+
+def test_start_marca_running_orfaos_como_failed() -> None:
+    store = _store()
+    orfaos = [enqueue_ingest(store, bid) for bid in (1, 2)]
+    for _ in orfaos:
+        claim_next(store, "ingest_jobs")  # processo anterior morreu com os jobs RUNNING
+    novo = enqueue_ingest(store, 3)
+    seen: list[int] = []
+    worker = JobWorker(store, [("ingest_jobs", lambda r: seen.append(int(r["base_id"])))],
+                       poll_interval=0.01)
+    worker.start()
+    try:
+        deadline = time.time() + 5
+        while not seen and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        worker.stop()
+    assert seen == [3]  # órfãos não rodam de novo sozinhos
+    for j in orfaos:
+        row = get_ingest_job(store, j)
+        assert row["status"] == "FAILED"  # type: ignore[index]
+        assert row["erro"] == "interrompido: sidecar reiniciado"  # type: ignore[index]
+    assert get_ingest_job(store, novo)["status"] == "DONE"  # type: ignore[index]
+    assert fail_orphans(store, "ingest_jobs") == 0
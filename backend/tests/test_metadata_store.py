@@ -0,0 +1,75 @@
+"""MetadataStore — conexão persistente e PRAGMAs do SQLite de metadados."""
+
+from __future__ import annotations
+
+from altool.metadata.store import MetadataStore
+
+
+def _store() -> MetadataStore:
+    store = MetadataStore(":memory:")
+    store.bootstrap()
+    return store
+
+
+def test_store_optimize_na_conexao_persistente() -> None:
+    store = _store()
+    store.optimize()
+    store.optimize()  # idempotente, mesma conexão
+    assert store.query_one("SELECT 1 AS x")["x"] == 1  # type: ignore[index]
+
+
+def test_bootstrap_aplica_pragmas_de_desempenho(tmp_path, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setenv("SQLITE_CACHE_KB", "32000")
+    store = MetadataStore(tmp_path / "meta.sqlite")
+    store.bootstrap()
+
+    def pragma(name: str) -> object:
+        return store.query_one(f"PRAGMA {name}")[0]  # type: ignore[index]
+
+    assert pragma("journal_mode") == "wal"
+    assert pragma("synchronous") == 1  # NORMAL
+    assert pragma("temp_store") == 2  # MEMORY
+    assert pragma("cache_size") == -32000
+    assert pragma("wal_autocheckpoint") == 1000
+    store.close()
+
+
+def test_wal_persiste_e_reabertura_nao_regrava(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    path = tmp_path / "meta.sqlite"
+    first = MetadataStore(path)
+    first.bootstrap()
+    first.close()
+    again = MetadataStore(path)
+    assert again._journal_mode() == "wal"  # já em WAL antes do bootstrap
+    again.bootstrap()
+    assert again._journal_mode() == "wal"
+    again.close()
+
+
+def test_tx_explicita_commit_rollback_e_aninhada() -> None:
+    store = _store()
+    with store.tx() as con:
+        con.execute("INSERT INTO base_subtypes (name) VALUES ('a')")
+        with store.tx() as inner:  # participa da transação externa
+            inner.execute("INSERT INTO base_subtypes (name) VALUES ('b')")
+        assert con.in_transaction
+    try:
+        with store.tx() as con:
+            con.execute("INSERT INTO base_subtypes (name) VALUES ('c')")
+            raise RuntimeError("falha")
+    except RuntimeError:
+        pass
+    names = [r["name"] for r in store.query_all("SELECT name FROM base_subtypes ORDER BY id")]
+    assert names == ["a", "b"]
+
+
+def test_tx_preserva_erro_original_se_sqlite_ja_desfez() -> None:
+    store = _store()
+    try:
+        with store.tx() as con:
+            con.execute("ROLLBACK")  # simula rollback automático do SQLite (FULL/IOERR)
+            raise RuntimeError("original")
+    except RuntimeError as e:
+        assert str(e) == "original"
+    with store.tx() as con:  # conexão segue utilizável
+        con.execute("INSERT INTO base_subtypes (name) VALUES ('x')")
@@ -0,0 +1,85 @@
+"""Resolução de `arquivo_caminho` (caminhos da v1, DATA_DIR realocado)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from altool.services import uploads
+from altool.services.paths import upload_dir
+from altool.services.uploads import resolve_upload_path
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("DATA_DIR", str(tmp_path))
+    monkeypatch.delenv("UPLOAD_DIR", raising=False)
+    (tmp_path / "uploads").mkdir()
+    uploads._index.clear()
+    return tmp_path
+
+
+def test_caminho_v1_relativo_resolve_pelo_nome_no_upload_dir(data_dir: Path) -> None:
+    f = data_dir / "uploads" / "abc_razao.xlsx"
+    f.write_bytes(b"x")
+    assert resolve_upload_path("uploads/abc_razao.xlsx") == str(f)
+    # caminho absoluto antigo (DATA_DIR movido) cai no mesmo arquivo pelo nome
+    assert resolve_upload_path("/home/app/data/uploads/abc_razao.xlsx") == str(f)
+
+
+def test_absoluto_existente_retorna_direto_sem_consultar_indice(
+    data_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (data_dir / "uploads" / "base.csv").write_text("outro\n")
+    (tmp_path / "fora").mkdir()
+    f = tmp_path / "fora" / "base.csv"
+    f.write_text("a\n1\n")
+    monkeypatch.setattr(uploads._index, "entries", lambda *a: pytest.fail("não deveria indexar"))
+    assert resolve_upload_path(str(f)) == str(f)
+
+
+def test_indice_enxerga_arquivo_novo_apos_mudanca_no_dir(data_dir: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        resolve_upload_path("uploads/novo.csv")
+    f = data_dir / "uploads" / "novo.csv"
+    f.write_text("a\n1\n")
+    assert resolve_upload_path("uploads/novo.csv") == str(f)
+
+
+def test_caminho_relativo_a_data_dir(data_dir: Path) -> None:
+    (data_dir / "outros").mkdir()
+    f = data_dir / "outros" / "base.csv"
+    f.write_text("a\n1\n")
+    assert resolve_upload_path("outros/base.csv") == str(f)
+
+
+def test_inexistente_lista_candidatos(data_dir: Path) -> None:
+    with pytest.raises(FileNotFoundError, match="tentados"):
+        resolve_upload_path("nao/existe.xlsb")
+
+
+def test_candidatos_com_mesmo_pai_fazem_um_scandir(
+    data_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (data_dir / "outros").mkdir()
+    (data_dir / "outros" / "a.csv").write_text("a\n")
+    (data_dir / "outros" / "b.csv").write_text("b\n")
+    real = uploads.os.scandir
+    scans: list[str] = []
+
+    def counting(path):  # type: ignore[no-untyped-def]
+        scans.append(str(path))
+        return real(path)
+
+    monkeypatch.setattr(uploads.os, "scandir", counting)
+    resolve_upload_path("outros/a.csv")
+    resolve_upload_path("outros/b.csv")
+    assert scans.count(str(data_dir / "outros")) == 1
+
+
+def test_upload_dir_recriado_se_apagado_com_sidecar_no_ar(data_dir: Path) -> None:
+    d = upload_dir()
+    assert d == data_dir / "uploads" and d.is_dir()
+    d.rmdir()  # usuário limpou a pasta de dados
+    assert upload_dir().is_dir()